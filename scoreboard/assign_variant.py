@@ -27,6 +27,7 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import re
 import unicodedata
@@ -34,7 +35,10 @@ from typing import Optional
 
 __all__ = ["assign_variant", "normalize"]
 
+_WHITESPACE_RE = re.compile(r"\s+")
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize(s: Optional[str]) -> str:
     """
     Normalize a string:
@@ -50,7 +54,7 @@ def normalize(s: Optional[str]) -> str:
         return ""
     s = unicodedata.normalize("NFKC", s).strip().lower()
     s = s.replace("ё", "е")
-    s = re.sub(r"\s+", " ", s)
+    s = _WHITESPACE_RE.sub(" ", s)
     return s
 
 
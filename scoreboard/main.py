@@ -1,11 +1,17 @@
 import argparse
+import bisect
+import functools
 import json
 import logging
+import math
+import os
 import re
 import shutil
 import subprocess
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo  # type: ignore
@@ -13,6 +19,11 @@ from zoneinfo import ZoneInfo  # type: ignore
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -22,12 +33,28 @@ task_types_threads = ["seq", "omp", "tbb", "stl", "all"]
 task_types_processes = ["mpi", "seq"]
 PERF_STAT_PRIORITY = {"median": 0, "mean": 1, "": 2}
 PERF_TIME_UNIT_TO_SECONDS = {"s": 1.0, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
+BENCHMARK_NAME_RE = re.compile(
+    r"(.+?)_(all|mpi|omp|seq|stl|tbb)_enabled(?:_(mean|median))?$"
+)
+BENCHMARK_SUFFIX_RE = re.compile(r"_(mpi|omp|tbb|stl|all|seq)_enabled.*")
+PROCESS_TASK_NAME_RE = re.compile(r"t(\d+)")
+# Efficiency percent thresholds and the share of max perf points reached at each:
+#   >=50 -> 100%; [45,50) -> 90%; [42,45) -> 80%; [40,42) -> 70%; [37,40) -> 60%;
+#   [35,37) -> 50%; [32,35) -> 40%; [30,32) -> 30%; [27,30) -> 20%; [25,27) -> 10%;
+#   <25 -> 0
+EFFICIENCY_THRESHOLDS = (25, 27, 30, 32, 35, 37, 40, 42, 45, 50)
+EFFICIENCY_SHARES = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+# Below this many info.json files a thread pool costs more than it saves
+PARALLEL_INFO_MIN_FILES = 64
 
 script_dir = Path(__file__).parent
 tasks_dir = script_dir.parent / "tasks"
 task_physical_dirs: dict[str, Path] = {}
-task_info_paths: dict[str, Path] = {}
+# Logical task name -> info.json path; all logical tasks of one dir share the string
+task_info_paths: dict[str, str] = {}
 process_task_indices: dict[str, int] = {}
+# Physical directory path -> whether it contains report.md
+task_report_flags: dict[str, bool] = {}
 # Salt is derived from the repository root directory name (dynamic)
 REPO_ROOT = script_dir.parent.resolve()
 # Salt format: "learning_process/<repo_name>"
@@ -49,6 +76,23 @@ except Exception:
         return 0
 
 
+def _load_json_file(path):
+    """Parse a JSON file with orjson when installed, stdlib json otherwise.
+
+    orjson rejects the NaN/Infinity literals Google Benchmark writes, so its
+    failures are retried with json; the fast path never changes what loads.
+    Malformed input raises json.JSONDecodeError.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def _now_msk():
     """Return current datetime in MSK if tz support is available, else local time."""
     try:
@@ -61,18 +105,16 @@ def _now_msk():
 
 def _read_task_statuses(task_dir: Path) -> dict:
     """Read per-task-type statuses (enabled/disabled) from settings.json if present."""
-    settings_path = task_dir / "settings.json"
-    if settings_path.exists():
-        try:
-            import json
-
-            with open(settings_path, "r") as f:
-                data = json.load(f)
-            tasks_block = data.get("tasks", {})
-            if isinstance(tasks_block, dict):
-                return tasks_block
-        except Exception as e:
-            logger.warning("Failed to parse task statuses in %s: %s", settings_path, e)
+    settings_path = os.path.join(task_dir, "settings.json")
+    try:
+        data = _load_json_file(settings_path)
+        tasks_block = data.get("tasks", {})
+        if isinstance(tasks_block, dict):
+            return tasks_block
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Failed to parse task statuses in %s: %s", settings_path, e)
     return {}
 
 
@@ -85,47 +127,133 @@ def _read_status_at(status_tree: dict, keys: list[str]) -> str | None:
     return str(node) if isinstance(node, str) else None
 
 
-def _task_info_path(dir_name: str) -> Path:
-    return task_info_paths.get(dir_name, tasks_dir / dir_name / "info.json")
+def _task_info_path(dir_name: str) -> str:
+    path = task_info_paths.get(dir_name)
+    if path is None:
+        path = os.path.join(tasks_dir, dir_name, "info.json")
+    return path
 
 
-def _student_info_for_dir(dir_name: str) -> dict:
-    info_path = _task_info_path(dir_name)
-    if not info_path.exists():
-        return {}
+@functools.lru_cache(maxsize=None)
+def _read_student_info(info_path: str) -> dict:
+    """Parse the student block of an info.json once; repeated lookups hit the cache.
+
+    Opening the file directly replaces a separate existence check.
+    """
     try:
-        with open(info_path, "r") as f:
-            data = json.load(f)
+        data = _load_json_file(info_path)
         if isinstance(data.get("student"), dict):
             return data.get("student", {})
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.warning("Failed to parse %s: %s", info_path, e)
     return {}
 
 
+def _student_info_for_dir(dir_name: str) -> dict:
+    return _read_student_info(_task_info_path(dir_name))
+
+
+def _prefetch_student_info() -> None:
+    """Warm the info.json cache for every discovered task with a thread pool.
+
+    Reads are I/O bound (slow on cold or network file systems) and independent,
+    so overlapping them shortens the first pass of the row builders.
+    """
+    info_paths = set(task_info_paths.values())
+    if len(info_paths) < PARALLEL_INFO_MIN_FILES:
+        return
+    with ThreadPoolExecutor() as pool:
+        for _ in pool.map(_read_student_info, info_paths):
+            pass
+
+
 def _student_full_name(student: dict) -> str:
     return str(student.get("full_name", "")).strip()
 
 
+def _student_group(student: dict) -> str:
+    return str(student.get("group_number", ""))
+
+
+@functools.lru_cache(maxsize=None)
+def _name_html(full_name: str) -> str:
+    return "<br/>".join(full_name.split())
+
+
+def _display_name(student: dict) -> str:
+    """Student full name with one word per line; empty when unknown."""
+    return _name_html(_student_full_name(student))
+
+
+def _identity_key(student: dict) -> tuple[str, str]:
+    """(full name, group): merges a student's process dirs and orders rows."""
+    return _student_full_name(student), _student_group(student)
+
+
 def _task_physical_dir(dir_name: str) -> Path:
     return task_physical_dirs.get(dir_name, tasks_dir / dir_name)
 
 
+def _dir_has_report(path: str) -> bool:
+    key = os.fspath(path)
+    present = task_report_flags.get(key)
+    if present is None:
+        present = os.path.isfile(os.path.join(key, "report.md"))
+        task_report_flags[key] = present
+    return present
+
+
 def _task_report_exists(dir_name: str, task_type: str) -> bool:
-    base_dir = _task_physical_dir(dir_name)
-    typed_report = base_dir / task_type / "report.md"
-    return typed_report.exists() or (base_dir / "report.md").exists()
+    base_dir = os.fspath(_task_physical_dir(dir_name))
+    impl_dir = os.path.join(base_dir, task_type)
+    return _dir_has_report(impl_dir) or _dir_has_report(base_dir)
 
 
-def _process_task_index_from_name(name: str, fallback: int) -> int:
-    import re
+class _SlugTranslation(dict):
+    """str.translate table keeping alphanumerics, "-" and "_"; filled lazily.
+
+    Group names may be Cyrillic, so a fixed ASCII table is not enough: each new
+    code point is classified with str.isalnum() once and then cached.
+    """
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        self[code] = value = ch if ch.isalnum() or ch in "-_" else "_"
+        return value
+
 
-    match = re.fullmatch(r"t(\d+)", name)
+_SLUG_TABLE = _SlugTranslation()
+
+
+def _process_task_index_from_name(name: str, fallback: int) -> int:
+    match = PROCESS_TASK_NAME_RE.fullmatch(name)
     if match:
         return int(match.group(1))
     return fallback
 
 
+def _subdir_names(path) -> set[str]:
+    """Return names of the immediate subdirectories of ``path`` (one scandir pass).
+
+    Whether the directory holds a report.md is recorded in task_report_flags on the way.
+    """
+    names: set[str] = set()
+    has_report = False
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.name == "report.md":
+                    has_report = entry.is_file()
+                elif entry.is_dir():
+                    names.add(entry.name)
+    except OSError:
+        pass
+    task_report_flags[os.fspath(path)] = has_report
+    return names
+
+
 def discover_tasks(tasks_dir, task_types):
     """Discover tasks and their implementation status from the filesystem.
 
@@ -137,72 +265,74 @@ def discover_tasks(tasks_dir, task_types):
     task_category_map: dict[str, str | None] = {}
 
     if tasks_dir.exists() and tasks_dir.is_dir():
-        for task_name_dir in tasks_dir.iterdir():
-            if task_name_dir.is_dir() and task_name_dir.name not in ["common"]:
-                task_name = task_name_dir.name
-                status_overrides = _read_task_statuses(task_name_dir)
-                task_info_paths[task_name] = task_name_dir / "info.json"
-                task_physical_dirs[task_name] = task_name_dir
-
-                threads_dir = task_name_dir / "threads"
-                processes_dir = task_name_dir / "processes"
-                is_meta_task = threads_dir.is_dir() or processes_dir.is_dir()
-                if is_meta_task:
-                    if threads_dir.is_dir():
-                        logical_name = f"{task_name}_threads"
-                        task_category_map[logical_name] = "threads"
-                        task_info_paths[logical_name] = task_name_dir / "info.json"
-                        task_physical_dirs[logical_name] = threads_dir
+        with os.scandir(tasks_dir) as it:
+            task_entries = [e for e in it if e.is_dir() and e.name not in ["common"]]
+        for entry in task_entries:
+            task_name = entry.name
+            task_name_dir = tasks_dir / task_name
+            present = _subdir_names(entry.path)
+            status_overrides = _read_task_statuses(task_name_dir)
+            info_path = os.path.join(entry.path, "info.json")
+            task_info_paths[task_name] = info_path
+            task_physical_dirs[task_name] = task_name_dir
+
+            is_meta_task = "threads" in present or "processes" in present
+            if is_meta_task:
+                if "threads" in present:
+                    threads_dir = task_name_dir / "threads"
+                    logical_name = f"{task_name}_threads"
+                    task_category_map[logical_name] = "threads"
+                    task_info_paths[logical_name] = info_path
+                    task_physical_dirs[logical_name] = threads_dir
+                    threads_present = _subdir_names(threads_dir)
+                    for task_type in task_types:
+                        if task_type in threads_present:
+                            status = _read_status_at(
+                                status_overrides, ["threads", task_type]
+                            )
+                            directories[logical_name][task_type] = (
+                                "disabled" if status == "disabled" else "done"
+                            )
+
+                if "processes" in present:
+                    processes_dir = task_name_dir / "processes"
+                    process_task_names = sorted(_subdir_names(processes_dir))
+                    for index, process_task_name in enumerate(
+                        process_task_names, start=1
+                    ):
+                        process_task_dir = processes_dir / process_task_name
+                        logical_name = f"{task_name}_processes_{process_task_name}"
+                        task_category_map[logical_name] = "processes"
+                        task_info_paths[logical_name] = info_path
+                        task_physical_dirs[logical_name] = process_task_dir
+                        process_task_indices[logical_name] = (
+                            _process_task_index_from_name(process_task_name, index)
+                        )
+                        impl_present = _subdir_names(process_task_dir)
                         for task_type in task_types:
-                            task_type_dir = threads_dir / task_type
-                            if task_type_dir.exists() and task_type_dir.is_dir():
+                            if task_type in impl_present:
                                 status = _read_status_at(
-                                    status_overrides, ["threads", task_type]
+                                    status_overrides,
+                                    ["processes", process_task_name, task_type],
                                 )
                                 directories[logical_name][task_type] = (
                                     "disabled" if status == "disabled" else "done"
                                 )
+                continue
 
-                    if processes_dir.is_dir():
-                        process_task_dirs = sorted(
-                            p for p in processes_dir.iterdir() if p.is_dir()
-                        )
-                        for index, process_task_dir in enumerate(
-                            process_task_dirs, start=1
-                        ):
-                            process_task_name = process_task_dir.name
-                            logical_name = f"{task_name}_processes_{process_task_name}"
-                            task_category_map[logical_name] = "processes"
-                            task_info_paths[logical_name] = task_name_dir / "info.json"
-                            task_physical_dirs[logical_name] = process_task_dir
-                            process_task_indices[logical_name] = (
-                                _process_task_index_from_name(process_task_name, index)
-                            )
-                            for task_type in task_types:
-                                task_type_dir = process_task_dir / task_type
-                                if task_type_dir.exists() and task_type_dir.is_dir():
-                                    status = _read_status_at(
-                                        status_overrides,
-                                        ["processes", process_task_name, task_type],
-                                    )
-                                    directories[logical_name][task_type] = (
-                                        "disabled" if status == "disabled" else "done"
-                                    )
-                    continue
-
-                task_category_map[task_name] = (
-                    "processes" if (task_name_dir / "mpi").is_dir() else "threads"
-                )
-                for task_type in task_types:
-                    task_type_dir = task_name_dir / task_type
-                    if task_type_dir.exists() and task_type_dir.is_dir():
-                        if task_name.endswith("_disabled"):
-                            clean_task_name = task_name[: -len("_disabled")]
-                            directories[clean_task_name][task_type] = "disabled"
-                        elif status_overrides.get(task_type) == "disabled":
-                            directories[task_name][task_type] = "disabled"
-                        else:
-                            directories[task_name][task_type] = "done"
+            task_category_map[task_name] = (
+                "processes" if "mpi" in present else "threads"
+            )
+            is_disabled_dir = task_name.endswith("_disabled")
+            for task_type in task_types:
+                if task_type in present:
+                    if is_disabled_dir:
+                        clean_task_name = task_name[: -len("_disabled")]
+                        directories[clean_task_name][task_type] = "disabled"
+                    elif status_overrides.get(task_type) == "disabled":
+                        directories[task_name][task_type] = "disabled"
+                    else:
+                        directories[task_name][task_type] = "done"
 
     return directories, task_category_map
 
@@ -213,9 +343,7 @@ directories, task_category_map = discover_tasks(tasks_dir, task_types)
 def parse_benchmark_name(name: str) -> tuple[str, str, str] | None:
     """Parse <task>_<impl>_enabled Google Benchmark names."""
     base_name = name.split("/", maxsplit=1)[0]
-    match = re.match(
-        r"(.+?)_(all|mpi|omp|seq|stl|tbb)_enabled(?:_(mean|median))?$", base_name
-    )
+    match = BENCHMARK_NAME_RE.match(base_name)
     if match is None:
         return None
     return match.group(1), match.group(2), match.group(3) or ""
@@ -225,25 +353,24 @@ def _benchmark_time_to_seconds(value: float, unit: str) -> float:
     return float(value) * PERF_TIME_UNIT_TO_SECONDS.get(unit, 1e-9)
 
 
-def _perf_record_priority(record: dict) -> int:
-    return PERF_STAT_PRIORITY.get(str(record.get("statistic", "")), 3)
-
-
 def load_benchmark_performance_data(benchmarks_dir: Path) -> dict[str, dict]:
     """Load Google Benchmark JSON files written by ppc_perf_tests.
 
     Returns raw benchmark times in seconds:
       benchmark task name -> implementation -> seconds
     """
-    if not benchmarks_dir.exists():
+    try:
+        with os.scandir(benchmarks_dir) as it:
+            json_paths = sorted(e.path for e in it if e.name.endswith(".json"))
+    except OSError:
         logger.warning("Benchmark JSON directory not found at %s", benchmarks_dir)
         return {}
 
-    selected: dict[tuple[str, str], dict] = {}
-    for json_path in sorted(benchmarks_dir.glob("*.json")):
+    # (task, implementation) -> (statistic priority, seconds)
+    selected: dict[tuple[str, str], tuple[int, float]] = {}
+    for json_path in json_paths:
         try:
-            with open(json_path, "r", encoding="utf-8") as file:
-                payload = json.load(file)
+            payload = _load_json_file(json_path)
         except (OSError, json.JSONDecodeError) as e:
             logger.warning("Failed to parse benchmark JSON %s: %s", json_path, e)
             continue
@@ -259,212 +386,161 @@ def load_benchmark_performance_data(benchmarks_dir: Path) -> dict[str, dict]:
                 )
             except (KeyError, TypeError, ValueError):
                 continue
-            record = {
-                "task": task_name,
-                "implementation": implementation,
-                "seconds": seconds,
-                "statistic": statistic or str(entry.get("aggregate_name", "")),
-            }
+            priority = PERF_STAT_PRIORITY.get(
+                statistic or str(entry.get("aggregate_name", "")), 3
+            )
             key = (task_name, implementation)
             previous = selected.get(key)
-            if previous is None or _perf_record_priority(
-                record
-            ) < _perf_record_priority(previous):
-                selected[key] = record
+            if previous is None or priority < previous[0]:
+                selected[key] = (priority, seconds)
 
     perf_stats: dict[str, dict] = {}
-    for record in selected.values():
-        perf_stats.setdefault(record["task"], {})[record["implementation"]] = (
-            f"{record['seconds']:.10g}"
-        )
+    for (task_name, implementation), (_, seconds) in selected.items():
+        perf_stats.setdefault(task_name, {})[implementation] = f"{seconds:.10g}"
     return perf_stats
 
 
 def calculate_performance_metrics(perf_val, eff_num_proc, task_type, seq_val=None):
     """Calculate acceleration and efficiency from raw times in seconds."""
+    acceleration, efficiency, _ = _performance_metrics(
+        perf_val, eff_num_proc, task_type, seq_val
+    )
+    return acceleration, efficiency
+
+
+@functools.lru_cache(maxsize=None)
+def _performance_metrics(perf_val, eff_num_proc, task_type, seq_val=None):
+    """Like calculate_performance_metrics, plus the efficiency percent as a number.
+
+    The third item is the percent rounded as displayed, or None when efficiency
+    is not a percentage, so callers can score it without re-parsing the string.
+    Inputs are the perf-map strings, so results are cached across page builds.
+    """
     acceleration = "?"
     efficiency = "?"
+    efficiency_pct = None
     try:
         if seq_val is None:
             perf_float = float(perf_val)
             if task_type == "seq" and perf_float > 0:
-                return "1.00", "N/A"
-            return acceleration, efficiency
+                return "1.00", "N/A", None
+            return acceleration, efficiency, None
 
         seq_t = float(seq_val)
         par_t = float(perf_val)
+        # isfinite rejects inf and NaN in one C call each
         if (
-            seq_t <= 0
-            or par_t <= 0
-            or seq_t == float("inf")
-            or par_t == float("inf")
-            or seq_t != seq_t
-            or par_t != par_t
+            not (math.isfinite(seq_t) and math.isfinite(par_t))
+            or min(seq_t, par_t) <= 0
         ):
-            return acceleration, efficiency
+            return acceleration, efficiency, None
         if min(seq_t, par_t) < 0.001:
             tiny_mark = "t &lt;<br/>1e-3"
-            return tiny_mark, tiny_mark
+            return tiny_mark, tiny_mark, None
         speedup = seq_t / par_t
         if task_type == "seq":
             acceleration = "1.00"
             efficiency = "N/A"
         else:
             acceleration = f"{speedup:.2f}"
-            efficiency = f"{speedup / eff_num_proc * 100:.2f}%"
+            raw_pct = speedup / eff_num_proc * 100
+            efficiency = f"{raw_pct:.2f}%"
+            efficiency_pct = round(raw_pct, 2)
     except (ValueError, TypeError):
         pass
-    return acceleration, efficiency
+    return acceleration, efficiency, efficiency_pct
 
 
 def _find_max_solution(points_info, task_type: str) -> int:
-    """Resolve max S for a given task type from points-info (threads list)."""
-    threads_tasks = (points_info.get("threads", {}) or {}).get("tasks", [])
-    for t in threads_tasks:
-        if str(t.get("name")) == task_type:
-            try:
-                return int(t.get("S", 0))
-            except Exception:
-                return 0
-    if task_type == "mpi":
-        return 0
-    return 0
+    """Resolve max S for a given task type from points-info (threads list).
 
-
-def _find_report_max(points_info, task_type: str) -> int:
-    """Resolve max Report (R) points for a given task type from points-info (threads).
-    Returns 0 if not found.
+    A first-match scan of the threads tasks only; main() reads the same value
+    from its prebuilt _index_points table instead.
     """
-    threads_tasks = (points_info.get("threads", {}) or {}).get("tasks", [])
-    for t in threads_tasks:
-        if str(t.get("name")) == task_type:
-            try:
-                return int(t.get("R", 0))
-            except Exception:
-                return 0
-    return 0
-
-
-def _find_performance_max(points_info, task_type: str) -> int:
-    """Resolve max Performance (A) points for a given task type (threads)."""
-    threads_tasks = (points_info.get("threads", {}) or {}).get("tasks", [])
-    for t in threads_tasks:
+    for t in (points_info.get("threads", {}) or {}).get("tasks", []):
         if str(t.get("name")) == task_type:
-            try:
-                return int(t.get("A", 0))
-            except Exception:
-                return 0
+            return _safe_int(t.get("S", 0))
     return 0
 
 
-def _calc_perf_points_from_efficiency(efficiency_str: str, max_points: int) -> float:
-    """Calculate Performance points as a real number (x.yy).
-
-    Mapping (eff -> percent of max):
-      >=50 -> 100; [45,50) -> 90; [42,45) -> 80; [40,42) -> 70; [37,40) -> 60;
-      [35,37) -> 50; [32,35) -> 40; [30,32) -> 30; [27,30) -> 20; [25,27) -> 10; <25 -> 0
-    Returns a float rounded to 2 decimals (no ceil).
-    """
-    if not isinstance(efficiency_str, str) or not efficiency_str.endswith("%"):
-        return 0.0
-    try:
-        val = float(efficiency_str.rstrip("%"))
-    except Exception:
+def _perf_points_from_percent(val: float, max_points: int) -> float:
+    """Performance points for a numeric efficiency percent, rounded to 2 decimals."""
+    if val != val:  # NaN sorts past every threshold in bisect
         return 0.0
-    perc = 0.0
-    if val >= 50:
-        perc = 1.0
-    elif 45 <= val < 50:
-        perc = 0.9
-    elif 42 <= val < 45:
-        perc = 0.8
-    elif 40 <= val < 42:
-        perc = 0.7
-    elif 37 <= val < 40:
-        perc = 0.6
-    elif 35 <= val < 37:
-        perc = 0.5
-    elif 32 <= val < 35:
-        perc = 0.4
-    elif 30 <= val < 32:
-        perc = 0.3
-    elif 27 <= val < 30:
-        perc = 0.2
-    elif 25 <= val < 27:
-        perc = 0.1
-    else:
-        perc = 0.0
+    perc = EFFICIENCY_SHARES[bisect.bisect_right(EFFICIENCY_THRESHOLDS, val)]
     pts = max_points * perc if max_points > 0 else 0.0
     # round to 2 decimals (banker's rounding acceptable here)
     return round(pts, 2)
 
 
-def _find_process_report_max(points_info, process_task_index: int) -> int:
-    """Get max report (R) points for process task by ordinal (1..3).
-    Looks up processes.tasks with names like 'mpi_task_1'.
-    """
-    proc = (points_info.get("processes", {}) or {}).get("tasks", [])
-    key = f"mpi_task_{process_task_index}"
-    for t in proc:
-        if str(t.get("name")) == key:
-            try:
-                return int(t.get("R", 0))
-            except Exception:
-                return 0
+def _safe_int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except Exception:
+        return default
+
+
+def _extract_points(block, key: str) -> int:
+    """Read a points value from a mapping or a list-of-maps block (per user's YAML example)."""
+    if isinstance(block, dict):
+        return _safe_int(block.get(key, 0))
+    if isinstance(block, list):
+        for item in block:
+            if isinstance(item, dict) and key in item:
+                return _safe_int(item.get(key, 0))
     return 0
 
 
-def _find_process_points(
-    points_info, process_task_index: int
-) -> tuple[int, int, int, int]:
-    """Return (S_mpi, S_seq, A_mpi, R) maxima for a given process task ordinal (1..3).
-    Supports both mapping and list-of-maps (per user's YAML example).
+def _index_points(points_info) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Flatten points-info task lists into name-keyed lookup tables.
+
+    Returns:
+        threads_idx: dict[task_type] -> {"S", "A", "R"}
+        proc_idx: dict["mpi_task_<n>"] -> {"S_mpi", "S_seq", "A_mpi", "R", "variants_max"}
+    The first entry wins when a name is repeated, matching the former linear scans.
+    main() builds the tables once and passes them to the row builders.
     """
-    proc_tasks = (points_info.get("processes", {}) or {}).get("tasks", [])
-    key = f"mpi_task_{process_task_index}"
-    for t in proc_tasks:
-        if str(t.get("name")) == key:
-
-            def _extract(obj, k):
-                if isinstance(obj, dict):
-                    return int(obj.get(k, 0))
-                if isinstance(obj, list):
-                    for it in obj:
-                        if isinstance(it, dict) and k in it:
-                            try:
-                                return int(it.get(k, 0))
-                            except Exception:
-                                return 0
-                return 0
-
-            mpi_blk = t.get("mpi", {})
-            seq_blk = t.get("seq", {})
-            s_mpi = _extract(mpi_blk, "S")
-            a_mpi = _extract(mpi_blk, "A")
-            s_seq = _extract(seq_blk, "S")
-            try:
-                r = int(t.get("R", 0))
-            except Exception:
-                r = 0
-            return s_mpi, s_seq, a_mpi, r
-    return 0, 0, 0, 0
-
-
-def _find_process_variants_max(points_info, process_task_index: int) -> int:
-    proc_tasks = (points_info.get("processes", {}) or {}).get("tasks", [])
-    key = f"mpi_task_{process_task_index}"
-    for t in proc_tasks:
-        if str(t.get("name")) == key:
-            try:
-                return int(t.get("variants_max", 1))
-            except Exception:
-                return 1
-    return 1
+    threads_idx: dict[str, dict] = {}
+    for t in (points_info.get("threads", {}) or {}).get("tasks", []):
+        threads_idx.setdefault(
+            str(t.get("name")),
+            {
+                "S": _safe_int(t.get("S", 0)),
+                "A": _safe_int(t.get("A", 0)),
+                "R": _safe_int(t.get("R", 0)),
+            },
+        )
+
+    proc_idx: dict[str, dict] = {}
+    for t in (points_info.get("processes", {}) or {}).get("tasks", []):
+        mpi_blk = t.get("mpi", {})
+        seq_blk = t.get("seq", {})
+        proc_idx.setdefault(
+            str(t.get("name")),
+            {
+                "S_mpi": _extract_points(mpi_blk, "S"),
+                "A_mpi": _extract_points(mpi_blk, "A"),
+                "S_seq": _extract_points(seq_blk, "S"),
+                "R": _safe_int(t.get("R", 0)),
+                "variants_max": _safe_int(t.get("variants_max", 1), 1),
+            },
+        )
+    return threads_idx, proc_idx
+
+
+_EMPTY_THREAD_POINTS = {"S": 0, "A": 0, "R": 0}
+_EMPTY_PROCESS_POINTS = {"S_mpi": 0, "S_seq": 0, "A_mpi": 0, "R": 0, "variants_max": 1}
+# Perf entry for a directory without benchmark results; shared, never mutated
+_EMPTY_PERF_ENTRY: dict = {}
 
 
 def get_solution_points_and_style(task_type, status, cfg):
     """Get solution points and CSS style based on task type and status."""
-    max_sol_points = _find_max_solution(cfg, task_type)
+    return _solution_points_and_style(_find_max_solution(cfg, task_type), status)
+
+
+def _solution_points_and_style(max_sol_points: int, status):
+    """Solution points and CSS style once max S for the task type is known."""
     sol_points = max_sol_points if status in ("done", "disabled") else 0
     solution_style = ""
     if status == "done":
@@ -475,6 +551,18 @@ def get_solution_points_and_style(task_type, status, cfg):
     return sol_points, solution_style
 
 
+def _copying_coefficient(cfg) -> float:
+    """Copying penalty coefficient; prefers new key 'copying', falls back to legacy 'plagiarism'."""
+    try:
+        return float(
+            (cfg.get("copying", {}) or cfg.get("plagiarism", {})).get(
+                "coefficient", 0.0
+            )
+        )
+    except Exception:
+        return 0.0
+
+
 def check_plagiarism_and_calculate_penalty(
     dir, task_type, sol_points, plagiarism_cfg, cfg, semester: str | None
 ):
@@ -484,8 +572,34 @@ def check_plagiarism_and_calculate_penalty(
       - legacy: { plagiarism: { seq: [...], omp: [...], ... } }
       - semesters: { threads: {plagiarism: {...}}, processes: {plagiarism: {...}} }
     """
+    return _copying_penalty(
+        dir,
+        task_type,
+        sol_points,
+        _copying_index(plagiarism_cfg, semester),
+        _copying_coefficient(cfg),
+    )
+
+
+def _copying_penalty(
+    dir, task_type, sol_points, copying_index: dict[str, frozenset], coefficient
+):
+    """check_plagiarism_and_calculate_penalty against a prebuilt _copying_index."""
     clean_dir = dir[: -len("_disabled")] if dir.endswith("_disabled") else dir
 
+    flagged = copying_index.get(task_type, frozenset())
+    is_cheated = dir in flagged or clean_dir in flagged
+    plagiarism_points = 0
+    if is_cheated:
+        plagiarism_points = -coefficient * sol_points
+    return is_cheated, plagiarism_points
+
+
+def _copying_index(plagiarism_cfg, semester: str | None) -> dict[str, frozenset]:
+    """Flagged directory names per task type for one copying config and semester.
+
+    main() builds one index per semester and passes it to the row builders.
+    """
     # Resolve copying/plagiarism mapping based on layout
     plag_map = {}
     if isinstance(plagiarism_cfg, dict) and (
@@ -507,21 +621,57 @@ def check_plagiarism_and_calculate_penalty(
             inner.get("copying") if "copying" in inner else inner.get("plagiarism", {})
         ) or {}
 
-    flagged_list = set(plag_map.get(task_type, []) or [])
-    is_cheated = dir in flagged_list or clean_dir in flagged_list
-    plagiarism_points = 0
-    if is_cheated:
-        # Prefer new key 'copying', fallback to legacy 'plagiarism'
-        try:
-            plag_coeff = float(
-                (cfg.get("copying", {}) or cfg.get("plagiarism", {})).get(
-                    "coefficient", 0.0
-                )
-            )
-        except Exception:
-            plag_coeff = 0.0
-        plagiarism_points = -plag_coeff * sol_points
-    return is_cheated, plagiarism_points
+    return {task_type: frozenset(names or ()) for task_type, names in plag_map.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _deadline_datetime(deadline_str: str) -> datetime:
+    """Parse a points-info deadline once; it is shared by every student of a task type."""
+    return datetime.fromisoformat(deadline_str)
+
+
+@functools.lru_cache(maxsize=None)
+def _last_commit_times(root: str) -> dict[str, int]:
+    """Last commit timestamp of every file and directory under ``root``.
+
+    One ``git log`` pass replaces a ``git log -1`` per task directory. Keys are
+    paths relative to ``root``; log output is newest first, so the first commit
+    seen for a path is its last change. Empty when git is unavailable.
+    Output is read as bytes and paths are decoded with os.fsdecode, so names
+    that are not valid in the locale encoding map like os.scandir names do.
+    """
+    git_cmd = [
+        "git",
+        "-C",
+        root,
+        "-c",
+        "core.quotePath=false",
+        "log",
+        "--no-renames",
+        "--relative",
+        "--format=%x00%ct",
+        "--name-only",
+    ]
+    try:
+        result = subprocess.run(git_cmd, capture_output=True)
+        lines = result.stdout.splitlines()
+        times: dict[str, int] = {}
+        commit_ts = None
+        for line in lines:
+            if line.startswith(b"\0"):
+                try:
+                    commit_ts = int(line[1:])
+                except ValueError:
+                    commit_ts = None
+            elif line and commit_ts is not None:
+                parts = os.fsdecode(line).split("/")
+                for depth in range(1, len(parts) + 1):
+                    times.setdefault("/".join(parts[:depth]), commit_ts)
+    except (OSError, ValueError) as e:
+        # Cached like a success: one failure must not re-run git per student
+        logger.warning("Failed to read git history of %s: %s", root, e)
+        return {}
+    return times
 
 
 def calculate_deadline_penalty(dir, task_type, status, deadlines_cfg, tasks_dir):
@@ -530,22 +680,18 @@ def calculate_deadline_penalty(dir, task_type, status, deadlines_cfg, tasks_dir)
     deadline_str = deadlines_cfg.get(task_type)
     if status == "done" and deadline_str:
         try:
-            deadline_dt = datetime.fromisoformat(deadline_str)
-            git_cmd = [
-                "git",
-                "log",
-                "-1",
-                "--format=%ct",
-                str(
-                    _task_physical_dir(
-                        dir[: -len("_disabled")] if dir.endswith("_disabled") else dir
-                    )
-                    / task_type
-                ),
-            ]
-            result = subprocess.run(git_cmd, capture_output=True, text=True)
-            if result.stdout.strip().isdigit():
-                commit_dt = datetime.fromtimestamp(int(result.stdout.strip()))
+            deadline_dt = _deadline_datetime(deadline_str)
+            task_path = (
+                _task_physical_dir(
+                    dir[: -len("_disabled")] if dir.endswith("_disabled") else dir
+                )
+                / task_type
+            )
+            commit_ts = _last_commit_times(str(tasks_dir)).get(
+                task_path.relative_to(tasks_dir).as_posix()
+            )
+            if commit_ts is not None:
+                commit_dt = datetime.fromtimestamp(commit_ts)
                 days_late = (commit_dt - deadline_dt).days
                 if days_late > 0:
                     deadline_points = -days_late
@@ -554,6 +700,40 @@ def calculate_deadline_penalty(dir, task_type, status, deadlines_cfg, tasks_dir)
     return deadline_points
 
 
+# (dir, task_type, status, deadline) -> penalty; filled by _memo_deadline_penalty
+_deadline_penalty_memo: dict[tuple, int] = {}
+
+
+def _memo_deadline_penalty(dir_name, task_type, status, deadlines_cfg) -> int:
+    """calculate_deadline_penalty keyed on the inputs it depends on.
+
+    The threads/processes pages and every group page score the same directories,
+    so each (dir, task type) pair is only scored once per run.
+    """
+    deadline = deadlines_cfg.get(task_type)
+    if status != "done" or not deadline:
+        # No penalty is possible; skip path building and the memo entirely
+        return 0
+    key = (dir_name, task_type, status, deadline)
+    points = _deadline_penalty_memo.get(key)
+    if points is None:
+        points = calculate_deadline_penalty(
+            dir_name, task_type, status, deadlines_cfg, tasks_dir
+        )
+        _deadline_penalty_memo[key] = points
+    return points
+
+
+def _memo_solution_points(sol_cache: dict, threads_idx: dict, task_type, status):
+    """get_solution_points_and_style memoized for one points-info threads index."""
+    key = (task_type, status)
+    result = sol_cache.get(key)
+    if result is None:
+        max_sol_points = threads_idx.get(task_type, _EMPTY_THREAD_POINTS)["S"]
+        result = sol_cache[key] = _solution_points_and_style(max_sol_points, status)
+    return result
+
+
 def load_configurations():
     """Load points-info (max points, deadlines, efficiency) and plagiarism lists."""
     points_info_path = Path(__file__).parent / "data" / "points-info.yml"
@@ -573,6 +753,122 @@ def load_configurations():
     return points_info, eff_num_proc, deadlines_cfg, plagiarism_cfg
 
 
+@dataclass(slots=True)
+class ThreadCell:
+    """One task-type cell of a threads scoreboard row."""
+
+    solution_points: int
+    solution_style: str
+    perf: str
+    acceleration: str
+    efficiency: str
+    perf_points: float
+    perf_points_display: str
+    deadline_points: int
+    plagiarised: bool
+    plagiarism_points: float
+    report: int
+
+
+@dataclass(slots=True)
+class ProcessCell:
+    """One mpi or seq cell of a processes scoreboard row.
+
+    Perf points are filled in by the row builder once both cells of a task are known.
+    """
+
+    solution_points: int
+    solution_style: str
+    perf: str
+    acceleration: str
+    efficiency: str
+    deadline_points: int
+    plagiarised: bool
+    plagiarism_points: float
+    disabled: bool = False
+    efficiency_pct: float | None = None
+    perf_points: float = 0
+    perf_points_display: float | str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class ThreadRow:
+    """One student (task directory) row of the threads scoreboard."""
+
+    task: str
+    variant: str
+    types: list[ThreadCell]
+    total: float
+    # Used to split rows into per-group pages; not rendered
+    group_number: str | int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ProcessRow:
+    """One student row of the processes scoreboard: mpi/seq cells per task."""
+
+    task: str
+    variant: str
+    groups: list[ProcessCell]
+    r_values: list[int]
+    r_total: int
+    total: float
+    group_number: str | int | None = None
+
+
+# Placeholder mpi/seq cells for a task the student has no directory for.
+# Templates only read cells, so every row shares the same two instances.
+_EMPTY_PROCESS_CELL = ProcessCell(
+    solution_points=0,
+    solution_style="background-color: #f5f5f5;",
+    perf="—",
+    acceleration="—",
+    efficiency="—",
+    deadline_points=0,
+    plagiarised=False,
+    plagiarism_points=0,
+)
+_EMPTY_PROCESS_PAIR = (_EMPTY_PROCESS_CELL, _EMPTY_PROCESS_CELL)
+
+
+@functools.lru_cache(maxsize=None)
+def _variant_label(full_name: str, group: str, repo: str, num_variants: int) -> str:
+    """1-based variant shown in the table, or "?" when it cannot be assigned.
+
+    assign_variant is a pure hash of its inputs; group pages revisit the same
+    students, so results are cached.
+    """
+    if num_variants == 1:
+        # A single variant needs no hashing: everyone gets variant 1
+        return "1"
+    # The only inputs assign_variant rejects; anything else it raises is a bug
+    if num_variants < 1 or not repo:
+        return "?"
+    v_idx = assign_variant(
+        full_name=full_name,
+        group=group,
+        repo=repo,
+        num_variants=num_variants,
+    )
+    return str(v_idx + 1)
+
+
+def _write_html(path: Path, html: str) -> None:
+    """Write a rendered page as UTF-8 bytes, bypassing the text I/O layer."""
+    path.write_bytes(html.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=1)
+def _jinja_env() -> Environment:
+    return Environment(loader=FileSystemLoader(script_dir / "templates"))
+
+
+@functools.lru_cache(maxsize=None)
+def _template(name: str):
+    """Load and compile a template once; every page render reuses it."""
+    return _jinja_env().get_template(name)
+
+
 def _build_rows_for_task_types(
     selected_task_types: list[str],
     dir_names: list[str],
@@ -580,111 +876,99 @@ def _build_rows_for_task_types(
     cfg,
     eff_num_proc,
     deadlines_cfg,
+    threads_idx: dict[str, dict],
+    copying_index: dict[str, frozenset],
+    copying_coeff: float,
 ):
-    """Build rows for the given list of task directories and selected task types."""
-    rows = []
-
-    def _load_student_info_label(dir_name: str):
-        s = _student_info_for_dir(dir_name)
-        parts = [p for p in _student_full_name(s).split() if p]
-        label = "<br/>".join(parts)
-        return label if label else None
+    """Build rows for the given list of task directories and selected task types.
 
-    def _load_student_fields(dir_name: str):
-        s = _student_info_for_dir(dir_name)
-        if not s:
-            return None
-        return _student_full_name(s), str(s.get("group_number", ""))
+    ``threads_idx`` and ``copying_index`` are the _index_points and threads
+    _copying_index tables main() builds once per run.
+    """
+    rows = []
+    sol_cache: dict[tuple, tuple] = {}
+    threads_vmax = int((cfg.get("threads", {}) or {}).get("variants_max", 1))
 
     for dir in sorted(dir_names):
         row_types = []
         total_count = 0
+        dir_statuses = directories[dir]
+        perf_entry = perf_stats.get(dir, _EMPTY_PERF_ENTRY)
+        seq_val = perf_entry.get("seq") if isinstance(perf_entry, dict) else None
         for task_type in selected_task_types:
-            status = directories[dir].get(task_type)
-            sol_points, solution_style = get_solution_points_and_style(
-                task_type, status, cfg
+            status = dir_statuses.get(task_type)
+            sol_points, solution_style = _memo_solution_points(
+                sol_cache, threads_idx, task_type, status
             )
 
             task_points = sol_points
-            is_cheated, plagiarism_points = check_plagiarism_and_calculate_penalty(
-                dir, task_type, sol_points, plagiarism_cfg, cfg, semester="threads"
+            is_cheated, plagiarism_points = _copying_penalty(
+                dir, task_type, sol_points, copying_index, copying_coeff
             )
             task_points += plagiarism_points
 
-            perf_val = perf_stats.get(dir, {}).get(task_type, "?")
-
-            seq_val = None
-            if isinstance(perf_stats.get(dir, {}), dict):
-                seq_val = perf_stats.get(dir, {}).get("seq")
-            acceleration, efficiency = calculate_performance_metrics(
+            perf_val = perf_entry.get(task_type, "?")
+            acceleration, efficiency, efficiency_pct = _performance_metrics(
                 perf_val, eff_num_proc, task_type, seq_val=seq_val
             )
 
             # Calculate deadline penalty points
-            deadline_points = calculate_deadline_penalty(
-                dir, task_type, status, deadlines_cfg, tasks_dir
+            deadline_points = _memo_deadline_penalty(
+                dir, task_type, status, deadlines_cfg
             )
 
             # Report presence: award R only if report.md exists inside the task directory
             report_present = _task_report_exists(dir, task_type)
-            report_points = _find_report_max(cfg, task_type) if report_present else 0
+            task_max = threads_idx.get(task_type, _EMPTY_THREAD_POINTS)
+            report_points = task_max["R"] if report_present else 0
 
             # Performance points P for non-seq types, based on efficiency
-            perf_max = _find_performance_max(cfg, task_type)
-            if task_type != "seq":
-                perf_points = _calc_perf_points_from_efficiency(efficiency, perf_max)
-                perf_points_display = (
-                    f"{perf_points:.2f}"
-                    if isinstance(efficiency, str) and efficiency.endswith("%")
-                    else "—"
-                )
+            perf_max = task_max["A"]
+            if task_type != "seq" and efficiency_pct is not None:
+                perf_points = _perf_points_from_percent(efficiency_pct, perf_max)
+                perf_points_display = f"{perf_points:.2f}"
             else:
                 perf_points = 0.0
                 perf_points_display = "—"
 
             row_types.append(
-                {
-                    "solution_points": sol_points,
-                    "solution_style": solution_style,
-                    "perf": perf_val,
-                    "acceleration": acceleration,
-                    "efficiency": efficiency,
-                    "perf_points": perf_points,
-                    "perf_points_display": perf_points_display,
-                    "deadline_points": deadline_points,
-                    "plagiarised": is_cheated,
-                    "plagiarism_points": plagiarism_points,
-                    "report": report_points,
-                }
+                ThreadCell(
+                    solution_points=sol_points,
+                    solution_style=solution_style,
+                    perf=perf_val,
+                    acceleration=acceleration,
+                    efficiency=efficiency,
+                    perf_points=perf_points,
+                    perf_points_display=perf_points_display,
+                    deadline_points=deadline_points,
+                    plagiarised=is_cheated,
+                    plagiarism_points=plagiarism_points,
+                    report=report_points,
+                )
             )
             # Total: include Solution + Performance + Report + Copying penalty (exclude Deadline)
             total_count += task_points + perf_points + report_points
 
-        label_name = _load_student_info_label(dir) or dir
+        student = _student_info_for_dir(dir)
+        label_name = _display_name(student) or dir
         # Generate variant for threads based on student info and variants_max
-        threads_vmax = int((cfg.get("threads", {}) or {}).get("variants_max", 1))
-        fields = _load_student_fields(dir)
-        if fields:
-            full_name, group = fields
-            try:
-                v_idx = assign_variant(
-                    full_name=full_name,
-                    group=group,
-                    repo=REPO_SALT,
-                    num_variants=threads_vmax,
-                )
-                variant = str(v_idx + 1)
-            except Exception:
-                variant = "?"
+        if student:
+            variant = _variant_label(
+                _student_full_name(student),
+                _student_group(student),
+                REPO_SALT,
+                threads_vmax,
+            )
         else:
             variant = "?"
         rows.append(
-            {
-                "task": label_name,
-                "variant": variant,
-                "types": row_types,
-                "total": total_count,
-            }
+            ThreadRow(
+                task=label_name,
+                variant=variant,
+                types=row_types,
+                total=total_count,
+                group_number=student.get("group_number"),
+            )
         )
     return rows
 
@@ -703,8 +987,6 @@ def main():
     global plagiarism_cfg
     plagiarism_cfg = plagiarism_cfg_local
 
-    env = Environment(loader=FileSystemLoader(Path(__file__).parent / "templates"))
-
     # Load optional display deadline labels from deadlines.yml.
     deadlines_display_threads: dict[str, str] | None = None
     deadlines_display_processes: dict[str, str] | None = None
@@ -749,7 +1031,9 @@ def main():
         script_dir.parent / "build" / "perf_stat_dir" / "benchmarks",
         script_dir.parent / "perf_stat_dir" / "benchmarks",
     ]
-    benchmarks_dir = next((p for p in benchmark_dirs if p.exists()), benchmark_dirs[0])
+    benchmarks_dir = next(
+        (p for p in benchmark_dirs if os.path.isdir(p)), benchmark_dirs[0]
+    )
     perf_stats_raw = load_benchmark_performance_data(benchmarks_dir)
 
     # Partition tasks by category derived from the filesystem layout.
@@ -785,7 +1069,7 @@ def main():
         return merged
 
     def _match_dir(benchmark_key: str) -> str | None:
-        base = re.sub(r"_(mpi|omp|tbb|stl|all|seq)_enabled.*", "", benchmark_key)
+        base = BENCHMARK_SUFFIX_RE.sub("", benchmark_key)
         for d in dir_names_sorted:
             if base.startswith(d) or d in base or benchmark_key.startswith(d):
                 return d
@@ -799,6 +1083,14 @@ def main():
         for t in targets:
             perf_stats[t] = _merge_perf_maps(perf_stats.get(t, {}), vals)
 
+    _prefetch_student_info()
+
+    # Points and copying lookups, built once and shared by every page
+    threads_idx, proc_idx = _index_points(cfg)
+    plag_coeff = _copying_coefficient(cfg)
+    threads_copying = _copying_index(plagiarism_cfg, "threads")
+    processes_copying = _copying_index(plagiarism_cfg, "processes")
+
     # Build rows for each page
     threads_rows = _build_rows_for_task_types(
         task_types_threads,
@@ -807,19 +1099,13 @@ def main():
         cfg,
         eff_num_proc,
         deadlines_cfg,
+        threads_idx,
+        threads_copying,
+        plag_coeff,
     )
 
     # Processes page: build 3 tasks as columns for a single student
-    def _load_student_info(dir_name: str):
-        return _student_info_for_dir(dir_name) or None
-
-    def _identity_key(student: dict) -> str:
-        return "|".join(
-            [
-                _student_full_name(student),
-                str(student.get("group_number", "")),
-            ]
-        )
+    sol_cache: dict[tuple, tuple] = {}
 
     def _build_cell(dir_name: str, ttype: str, perf_map: dict[str, dict]):
         """Build one MPI/SEQ cell; respects disabled suffix and missing perf."""
@@ -838,61 +1124,81 @@ def main():
             solution_style = "background-color: pink;"
             perf_val = "—"
             acceleration, efficiency = ("—", "—")
+            efficiency_pct = None
         else:
-            sol_points, solution_style = get_solution_points_and_style(
-                ttype, status, cfg
+            sol_points, solution_style = _memo_solution_points(
+                sol_cache, threads_idx, ttype, status
             )
-            perf_val = perf_map.get(clean_name, {}).get(ttype, "—")
+            perf_entry = perf_map.get(clean_name, _EMPTY_PERF_ENTRY)
+            perf_val = perf_entry.get(ttype, "—")
             # If we have raw times, compute speedup against seq time when available
-            seq_val = None
-            if isinstance(perf_map.get(clean_name, {}), dict):
-                seq_val = perf_map.get(clean_name, {}).get("seq")
-            acceleration, efficiency = calculate_performance_metrics(
+            seq_val = perf_entry.get("seq") if isinstance(perf_entry, dict) else None
+            acceleration, efficiency, efficiency_pct = _performance_metrics(
                 perf_val, eff_num_proc, ttype, seq_val=seq_val
             )
 
         task_points = sol_points
-        is_cheated, plagiarism_points = check_plagiarism_and_calculate_penalty(
-            clean_name, ttype, sol_points, plagiarism_cfg, cfg, semester="processes"
+        is_cheated, plagiarism_points = _copying_penalty(
+            clean_name, ttype, sol_points, processes_copying, plag_coeff
         )
         task_points += plagiarism_points
-        deadline_points = calculate_deadline_penalty(
-            clean_name, ttype, status, deadlines_cfg, tasks_dir
+        deadline_points = _memo_deadline_penalty(
+            clean_name, ttype, status, deadlines_cfg
         )
         return (
-            {
-                "solution_points": sol_points,
-                "solution_style": solution_style,
-                "perf": perf_val,
-                "acceleration": acceleration,
-                "efficiency": efficiency,
-                "deadline_points": deadline_points,
-                "plagiarised": is_cheated,
-                "plagiarism_points": plagiarism_points,
-                "disabled": is_disabled,
-            },
+            ProcessCell(
+                solution_points=sol_points,
+                solution_style=solution_style,
+                perf=perf_val,
+                acceleration=acceleration,
+                efficiency=efficiency,
+                deadline_points=deadline_points,
+                plagiarised=is_cheated,
+                plagiarism_points=plagiarism_points,
+                disabled=is_disabled,
+                efficiency_pct=efficiency_pct,
+            ),
             task_points,
         )
 
+    def _settle_process_side(cell: ProcessCell, status, s_max) -> tuple[int, float]:
+        """Fill solution and copying points of one mpi/seq cell of a task.
+
+        Disabled sides still show their max S. Returns (S earned, copying penalty).
+        """
+        submitted = status in ("done", "disabled")
+        cell.solution_points = s_max if submitted else 0
+        cell.plagiarism_points = (
+            -plag_coeff * s_max if (submitted and cell.plagiarised) else 0
+        )
+        return cell.solution_points, cell.plagiarism_points
+
     expected_numbers = [1, 2, 3]
     fallback_process_tasknum = expected_numbers[0]
+    # Max points per expected task number, resolved once for every row
+    proc_maxes = [
+        proc_idx.get(f"mpi_task_{n}", _EMPTY_PROCESS_POINTS) for n in expected_numbers
+    ]
+    proc_vmaxes = [proc_max["variants_max"] for proc_max in proc_maxes]
+    proc_variant_salts = [f"{REPO_SALT}/processes/task-{n}" for n in expected_numbers]
     proc_top_headers = [f"task-{n}" for n in expected_numbers]
 
-    def _sort_identity(student: dict):
-        return (
-            _student_full_name(student),
-            str(student.get("group_number", "")),
-        )
-
     def _build_process_rows(processes_dirs: list[str]):
         """Build rows for all unique students found in processes dirs."""
-        identity_map: dict[str, dict] = {}
-        for d in processes_dirs:
-            s = _load_student_info(d)
+        identity_map: dict[tuple[str, str], dict] = {}
+        # Sorted walk keeps the dir chosen for a task number deterministic
+        for d in sorted(processes_dirs):
+            s = _student_info_for_dir(d)
             if not s:
                 continue
             key = _identity_key(s)
-            entry = identity_map.setdefault(key, {"student": s, "dir_map": {}})
+            entry = identity_map.get(key)
+            if entry is None:
+                entry = identity_map[key] = {
+                    "student": s,
+                    "name_html": _name_html(key[0]) or "processes",
+                    "dir_map": {},
+                }
             if d in process_task_indices:
                 tn = process_task_indices[d]
             else:
@@ -903,141 +1209,79 @@ def main():
             entry["dir_map"][tn] = d
 
         rows_local = []
-        for key, entry in sorted(
-            identity_map.items(), key=lambda kv: _sort_identity(kv[1]["student"])
-        ):
+        for key in sorted(identity_map):
+            entry = identity_map[key]
             student = entry["student"]
+            student_full_name, student_group = key
             dir_map: dict[int, str] = entry["dir_map"]
-            proc_groups: list[dict] = []
+            proc_groups: list[ProcessCell] = []
             proc_r_values: list[int] = []
             total_points_sum = 0
 
-            for n in expected_numbers:
+            for n, proc_max in zip(expected_numbers, proc_maxes):
                 d = dir_map.get(n)
                 if d:
-                    group_cells = []
-                    for ttype in ["mpi", "seq"]:
-                        cell, _ = _build_cell(d, ttype, perf_stats)
-                        group_cells.append(cell)
+                    mpi_cell, _ = _build_cell(d, "mpi", perf_stats)
+                    seq_cell, _ = _build_cell(d, "seq", perf_stats)
 
-                    s_mpi, s_seq, a_mpi, r_max = _find_process_points(cfg, n)
+                    a_mpi = proc_max["A_mpi"]
+                    r_max = proc_max["R"]
                     # Use clean name to check status and disable cells properly
                     clean_d = d[: -len("_disabled")] if d.endswith("_disabled") else d
                     status_mpi = directories[clean_d].get("mpi")
                     status_seq = directories[clean_d].get("seq")
-                    has_mpi = status_mpi in ("done", "disabled")
-                    has_seq = status_seq in ("done", "disabled")
                     report_present = _task_report_exists(
                         d, "seq"
                     ) or _task_report_exists(d, "mpi")
 
-                    mpi_eff = group_cells[0].get("efficiency", "N/A")
-                    perf_points_mpi = (
-                        _calc_perf_points_from_efficiency(mpi_eff, a_mpi)
-                        if (status_mpi == "done" and status_seq == "done")
-                        else 0
-                    )
-                    perf_points_mpi_display = (
-                        perf_points_mpi
-                        if isinstance(mpi_eff, str) and mpi_eff.endswith("%")
-                        else "—"
+                    mpi_pct = mpi_cell.efficiency_pct
+                    if status_mpi == "done" and status_seq == "done":
+                        perf_points_mpi = (
+                            _perf_points_from_percent(mpi_pct, a_mpi)
+                            if mpi_pct is not None
+                            else 0.0
+                        )
+                    else:
+                        perf_points_mpi = 0
+                    mpi_cell.perf_points = perf_points_mpi
+                    mpi_cell.perf_points_display = (
+                        perf_points_mpi if mpi_pct is not None else "—"
                     )
+                    seq_cell.perf_points = 0
 
-                    display_mpi_pts = (
-                        s_mpi if status_mpi == "disabled" else (s_mpi if has_mpi else 0)
-                    )
-                    display_seq_pts = (
-                        s_seq if status_seq == "disabled" else (s_seq if has_seq else 0)
+                    s_mpi, p_mpi = _settle_process_side(
+                        mpi_cell, status_mpi, proc_max["S_mpi"]
                     )
-                    group_cells[0]["solution_points"] = display_mpi_pts
-                    group_cells[1]["solution_points"] = display_seq_pts
-                    group_cells[0]["perf_points"] = perf_points_mpi
-                    group_cells[0]["perf_points_display"] = perf_points_mpi_display
-                    group_cells[1]["perf_points"] = 0
-
-                    try:
-                        plag_coeff = float(
-                            (cfg.get("copying", {}) or cfg.get("plagiarism", {})).get(
-                                "coefficient", 0.0
-                            )
-                        )
-                    except Exception:
-                        plag_coeff = 0.0
-                    p_mpi = (
-                        -plag_coeff * s_mpi
-                        if (has_mpi and group_cells[0].get("plagiarised"))
-                        else 0
+                    s_seq, p_seq = _settle_process_side(
+                        seq_cell, status_seq, proc_max["S_seq"]
                     )
-                    p_seq = (
-                        -plag_coeff * s_seq
-                        if (has_seq and group_cells[1].get("plagiarised"))
-                        else 0
-                    )
-                    group_cells[0]["plagiarism_points"] = p_mpi
-                    group_cells[1]["plagiarism_points"] = p_seq
-
-                    s_inc = (s_mpi if has_mpi else 0) + (s_seq if has_seq else 0)
-                    p_inc = perf_points_mpi
                     r_inc = r_max if report_present else 0
-                    total_points_sum += s_inc + p_inc + r_inc + p_mpi + p_seq
+                    total_points_sum += (
+                        s_mpi + s_seq + perf_points_mpi + r_inc + p_mpi + p_seq
+                    )
 
-                    proc_groups.extend(group_cells)
+                    proc_groups.append(mpi_cell)
+                    proc_groups.append(seq_cell)
                     proc_r_values.append(r_inc)
                 else:
-                    proc_groups.extend(
-                        [
-                            {
-                                "solution_points": 0,
-                                "solution_style": "background-color: #f5f5f5;",
-                                "perf": "—",
-                                "acceleration": "—",
-                                "efficiency": "—",
-                                "deadline_points": 0,
-                                "plagiarised": False,
-                                "plagiarism_points": 0,
-                            },
-                            {
-                                "solution_points": 0,
-                                "solution_style": "background-color: #f5f5f5;",
-                                "perf": "—",
-                                "acceleration": "—",
-                                "efficiency": "—",
-                                "deadline_points": 0,
-                                "plagiarised": False,
-                                "plagiarism_points": 0,
-                            },
-                        ]
-                    )
+                    proc_groups.extend(_EMPTY_PROCESS_PAIR)
                     proc_r_values.append(0)
 
-            student_full_name = _student_full_name(student)
-            name_parts = [p for p in student_full_name.split() if p]
-            name_html = "<br/>".join([p for p in name_parts if p]) or "processes"
-
-            variants_render = []
-            for n in expected_numbers:
-                vmax = _find_process_variants_max(cfg, n)
-                try:
-                    v_idx = assign_variant(
-                        full_name=student_full_name,
-                        group=str(student.get("group_number", "")),
-                        repo=f"{REPO_SALT}/processes/task-{n}",
-                        num_variants=vmax,
-                    )
-                    variants_render.append(str(v_idx + 1))
-                except Exception:
-                    variants_render.append("?")
-            row_variant = "<br/>".join(variants_render)
+            row_variant = "<br/>".join(
+                _variant_label(student_full_name, student_group, salt, vmax)
+                for salt, vmax in zip(proc_variant_salts, proc_vmaxes)
+            )
 
             rows_local.append(
-                {
-                    "task": name_html,
-                    "variant": row_variant,
-                    "groups": proc_groups,
-                    "r_values": proc_r_values,
-                    "r_total": sum(proc_r_values),
-                    "total": total_points_sum,
-                }
+                ProcessRow(
+                    task=entry["name_html"],
+                    variant=row_variant,
+                    groups=proc_groups,
+                    r_values=proc_r_values,
+                    r_total=sum(proc_r_values),
+                    total=total_points_sum,
+                    group_number=student.get("group_number"),
+                )
             )
         return rows_local
 
@@ -1049,16 +1293,6 @@ def main():
         proc_group_headers.append({"type": "mpi"})
         proc_group_headers.append({"type": "seq"})
 
-    # Rebuild threads rows with resolved perf stats
-    threads_rows = _build_rows_for_task_types(
-        task_types_threads,
-        threads_task_dirs,
-        perf_stats,
-        cfg,
-        eff_num_proc,
-        deadlines_cfg,
-    )
-
     parser = argparse.ArgumentParser(description="Generate HTML scoreboard.")
     parser.add_argument(
         "-o", "--output", type=str, required=True, help="Output directory path"
@@ -1070,11 +1304,10 @@ def main():
 
     # Render tables
     generated_msk = _now_msk().strftime("%Y-%m-%d %H:%M:%S")
-    table_template = env.get_template("index.html.j2")
+    table_template = _template("index.html.j2")
     threads_vmax = int((cfg.get("threads", {}) or {}).get("variants_max", 1))
     # Build display deadlines from explicit file values.
-    threads_order = task_types_threads
-    dl_threads_out = _thread_deadline_labels(threads_order)
+    dl_threads_out = _thread_deadline_labels(task_types_threads)
 
     threads_html = table_template.render(
         task_types=task_types_threads,
@@ -1085,8 +1318,7 @@ def main():
         deadlines_threads=dl_threads_out,
     )
     # Use dedicated template for processes table layout
-    processes_template = env.get_template("processes.html.j2")
-    proc_vmaxes = [_find_process_variants_max(cfg, n) for n in expected_numbers]
+    processes_template = _template("processes.html.j2")
     # Build display deadlines for processes in task order (1..3).
     proc_deadlines_list = _process_deadline_labels(expected_numbers)
 
@@ -1100,65 +1332,40 @@ def main():
         deadlines_processes=proc_deadlines_list,
     )
 
-    with open(output_path / "threads.html", "w") as f:
-        f.write(threads_html)
-    with open(output_path / "processes.html", "w") as f:
-        f.write(processes_html)
+    _write_html(output_path / "threads.html", threads_html)
+    _write_html(output_path / "processes.html", processes_html)
 
     # ——— Build per-group pages and group menus ————————————————————————
-    def _load_group_number(dir_name: str):
-        import json
-
-        info_path = _task_info_path(dir_name)
-        if not info_path.exists():
-            return None
-        try:
-            with open(info_path, "r") as f:
-                data = json.load(f)
-            return data.get("student", {}).get("group_number")
-        except Exception:
-            return None
-
     def _slugify(text: str) -> str:
-        return "".join(
-            ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in str(text)
-        )
-
-    # Collect groups
-    threads_groups = sorted(
-        set(filter(None, (_load_group_number(d) for d in threads_task_dirs)))
-    )
-    processes_groups = sorted(
-        set(filter(None, (_load_group_number(d) for d in processes_task_dirs)))
-    )
+        return str(text).translate(_SLUG_TABLE)
+
+    # Split the already built rows by student group; order within a group is kept
+    threads_rows_by_group = defaultdict(list)
+    for row in threads_rows:
+        if row.group_number:
+            threads_rows_by_group[row.group_number].append(row)
+    processes_rows_by_group = defaultdict(list)
+    for row in processes_rows:
+        if row.group_number:
+            processes_rows_by_group[row.group_number].append(row)
+    threads_groups = sorted(threads_rows_by_group)
+    processes_groups = sorted(processes_rows_by_group)
 
     # Threads: per-group pages
     threads_groups_menu = []
     for g in threads_groups:
         slug = _slugify(g)
         out_file = output_path / f"threads_{slug}.html"
-        filtered_dirs = [d for d in threads_task_dirs if _load_group_number(d) == g]
-        rows_g = _build_rows_for_task_types(
-            task_types_threads,
-            filtered_dirs,
-            perf_stats,
-            cfg,
-            eff_num_proc,
-            deadlines_cfg,
-        )
-        # Rebuild deadline labels for this page.
-        dl_threads_out_g = _thread_deadline_labels(threads_order)
-
+        # Headers and deadline labels are the same as on the main threads page
         html_g = table_template.render(
             task_types=task_types_threads,
-            rows=rows_g,
+            rows=threads_rows_by_group[g],
             generated_msk=generated_msk,
             repo_salt=REPO_SALT,
             threads_variants_max=threads_vmax,
-            deadlines_threads=dl_threads_out_g,
+            deadlines_threads=dl_threads_out,
         )
-        with open(out_file, "w") as f:
-            f.write(html_g)
+        _write_html(out_file, html_g)
         threads_groups_menu.append({"href": out_file.name, "title": g})
 
     # Processes: per-group pages
@@ -1166,56 +1373,22 @@ def main():
     for g in processes_groups:
         slug = _slugify(g)
         out_file = output_path / f"processes_{slug}.html"
-        filtered_dirs = [d for d in processes_task_dirs if _load_group_number(d) == g]
-
-        # Reuse earlier logic but limited to filtered_dirs
-        def _load_student_info_group(dir_name: str):
-            info_path = _task_info_path(dir_name)
-            if not info_path.exists():
-                return None
-            try:
-                with open(info_path, "r") as f:
-                    data = json.load(f)
-                return data.get("student", {})
-            except Exception:
-                return None
-
-        def _id_key(stud: dict) -> str:
-            return "|".join(
-                [
-                    _student_full_name(stud),
-                    str(stud.get("group_number", "")),
-                ]
-            )
-
-        proc_top_headers_g = [f"task-{n}" for n in [1, 2, 3]]
-        proc_group_headers_g = []
-        for _ in [1, 2, 3]:
-            proc_group_headers_g.append({"type": "mpi"})
-            proc_group_headers_g.append({"type": "seq"})
-
-        rows_g = _build_process_rows(filtered_dirs)
-
-        proc_vmaxes_g = [_find_process_variants_max(cfg, n) for n in [1, 2, 3]]
-        # Build display deadlines for processes group page.
-        proc_deadlines_list_g = _process_deadline_labels([1, 2, 3])
-
+        # Headers and deadline labels are the same as on the main processes page
         html_g = processes_template.render(
-            top_task_names=proc_top_headers_g,
-            group_headers=proc_group_headers_g,
-            rows=rows_g,
+            top_task_names=proc_top_headers,
+            group_headers=proc_group_headers,
+            rows=processes_rows_by_group[g],
             generated_msk=generated_msk,
             repo_salt=REPO_SALT,
-            processes_variants_max=proc_vmaxes_g,
-            deadlines_processes=proc_deadlines_list_g,
+            processes_variants_max=proc_vmaxes,
+            deadlines_processes=proc_deadlines_list,
         )
-        with open(out_file, "w") as f:
-            f.write(html_g)
+        _write_html(out_file, html_g)
         processes_groups_menu.append({"href": out_file.name, "title": g})
 
     # Render index menu page
     try:
-        menu_template = env.get_template("menu_index.html.j2")
+        menu_template = _template("menu_index.html.j2")
     except Exception:
         # Simple fallback menu if template missing
         menu_html_content = (
@@ -1238,8 +1411,7 @@ def main():
             generated_msk=generated_msk,
         )
 
-    with open(output_path / "index.html", "w") as f:
-        f.write(menu_html_content)
+    _write_html(output_path / "index.html", menu_html_content)
 
     # Copy static assets
     static_src = script_dir / "static"
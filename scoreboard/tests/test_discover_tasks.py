@@ -2,7 +2,12 @@
 Tests for the discover_tasks function.
 """
 
-from main import discover_tasks
+import json
+import os
+from collections import defaultdict
+
+import main
+from main import _process_task_index_from_name, _read_status_at, discover_tasks
 
 
 class TestDiscoverTasks:
@@ -108,3 +113,140 @@ class TestDiscoverTasks:
         assert result["example_task"]["omp"] == "done"
         # stl should not be included even though directory exists
         assert "stl" not in result["example_task"]
+
+
+def _listdir_discover(tasks_dir, task_types):
+    """Reference discovery using os.listdir/os.path.isdir, as done before scandir."""
+    directories = defaultdict(dict)
+    categories = {}
+    process_indices = {}
+
+    def subdirs(path):
+        return sorted(
+            n for n in os.listdir(path) if os.path.isdir(os.path.join(path, n))
+        )
+
+    for task_name in subdirs(tasks_dir):
+        if task_name == "common":
+            continue
+        task_dir = os.path.join(tasks_dir, task_name)
+        overrides = main._read_task_statuses(task_dir)
+        threads_dir = os.path.join(task_dir, "threads")
+        processes_dir = os.path.join(task_dir, "processes")
+        if os.path.isdir(threads_dir) or os.path.isdir(processes_dir):
+            if os.path.isdir(threads_dir):
+                logical = f"{task_name}_threads"
+                categories[logical] = "threads"
+                for task_type in task_types:
+                    if os.path.isdir(os.path.join(threads_dir, task_type)):
+                        status = _read_status_at(overrides, ["threads", task_type])
+                        directories[logical][task_type] = (
+                            "disabled" if status == "disabled" else "done"
+                        )
+            if os.path.isdir(processes_dir):
+                for index, name in enumerate(subdirs(processes_dir), start=1):
+                    logical = f"{task_name}_processes_{name}"
+                    categories[logical] = "processes"
+                    process_indices[logical] = _process_task_index_from_name(
+                        name, index
+                    )
+                    for task_type in task_types:
+                        impl_dir = os.path.join(processes_dir, name, task_type)
+                        if os.path.isdir(impl_dir):
+                            status = _read_status_at(
+                                overrides, ["processes", name, task_type]
+                            )
+                            directories[logical][task_type] = (
+                                "disabled" if status == "disabled" else "done"
+                            )
+            continue
+        categories[task_name] = (
+            "processes" if os.path.isdir(os.path.join(task_dir, "mpi")) else "threads"
+        )
+        for task_type in task_types:
+            if os.path.isdir(os.path.join(task_dir, task_type)):
+                if task_name.endswith("_disabled"):
+                    directories[task_name[: -len("_disabled")]][task_type] = "disabled"
+                elif overrides.get(task_type) == "disabled":
+                    directories[task_name][task_type] = "disabled"
+                else:
+                    directories[task_name][task_type] = "done"
+    return dict(directories), categories, process_indices
+
+
+class TestDiscoverTasksMatchesListdir:
+    """discover_tasks (os.scandir) against the os.listdir/isdir reference."""
+
+    task_types = ["seq", "omp", "stl", "tbb", "all", "mpi"]
+
+    def _make_tree(self, tasks_dir):
+        for rel in [
+            "plain/seq",
+            "plain/omp",
+            ".hidden_task/seq",
+            "plain/.git_like/seq",
+            "gone_disabled/seq",
+            "gone_disabled/stl",
+            "mpi_task/mpi",
+            "mpi_task/seq",
+            "overridden/seq",
+            "overridden/tbb",
+            "meta/threads/omp",
+            "meta/threads/seq",
+            "meta/processes/t2/mpi",
+            "meta/processes/t2/seq",
+            "meta/processes/other/seq",
+            "common/seq",
+        ]:
+            (tasks_dir / rel).mkdir(parents=True, exist_ok=True)
+        # Files named like task types and reports are not implementations
+        (tasks_dir / "plain" / "stl").write_text("not a directory")
+        (tasks_dir / "plain" / "report.md").write_text("# report")
+        (tasks_dir / "mpi_task" / "report.md").mkdir()
+        (tasks_dir / "meta" / "processes" / "t2" / "report.md").write_text("r")
+        (tasks_dir / "stray_file.txt").write_text("x")
+        (tasks_dir / "overridden" / "settings.json").write_text(
+            json.dumps({"tasks": {"tbb": "disabled"}})
+        )
+        (tasks_dir / "meta" / "settings.json").write_text(
+            json.dumps({"tasks": {"processes": {"t2": {"mpi": "disabled"}}}})
+        )
+
+    def test_matches_reference(self, temp_dir):
+        """Statuses, categories and process indices match the listdir scan."""
+        tasks_dir = temp_dir / "tasks"
+        self._make_tree(tasks_dir)
+
+        directories, categories = discover_tasks(tasks_dir, self.task_types)
+        ref_dirs, ref_categories, ref_indices = _listdir_discover(
+            tasks_dir, self.task_types
+        )
+
+        assert dict(directories) == ref_dirs
+        assert categories == ref_categories
+        for name, index in ref_indices.items():
+            assert main.process_task_indices[name] == index
+        # Spot-check the cases the reference is meant to cover
+        assert directories[".hidden_task"] == {"seq": "done"}
+        assert directories["gone"] == {"seq": "disabled", "stl": "disabled"}
+        assert "gone_disabled" not in directories
+        assert directories["plain"] == {"seq": "done", "omp": "done"}
+        assert directories["overridden"]["tbb"] == "disabled"
+        assert directories["meta_processes_t2"] == {"mpi": "disabled", "seq": "done"}
+        assert "common" not in directories
+
+    def test_report_flags_match_isfile(self, temp_dir):
+        """Report presence cached during the scan equals os.path.isfile."""
+        tasks_dir = temp_dir / "tasks"
+        self._make_tree(tasks_dir)
+        main.task_report_flags.clear()
+
+        discover_tasks(tasks_dir, self.task_types)
+
+        assert main.task_report_flags
+        for path, present in main.task_report_flags.items():
+            assert present == os.path.isfile(os.path.join(path, "report.md")), path
+        assert main.task_report_flags[str(tasks_dir / "plain")] is True
+        # A directory named report.md is not a report
+        assert main.task_report_flags[str(tasks_dir / "mpi_task")] is False
+        assert main.task_report_flags[str(tasks_dir / "gone_disabled")] is False
@@ -0,0 +1,145 @@
+"""
+Tests for the _last_commit_times git history index.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import main
+from main import _last_commit_times
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+
+def _git(repo, *args, timestamp=None):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_NAME="test",
+        GIT_AUTHOR_EMAIL="test@example.com",
+        GIT_COMMITTER_NAME="test",
+        GIT_COMMITTER_EMAIL="test@example.com",
+    )
+    if timestamp is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"@{timestamp} +0000"
+    subprocess.run(["git", "-C", str(repo), *args], check=True, env=env)
+
+
+def _commit(repo, timestamp):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", f"commit {timestamp}", timestamp=timestamp)
+
+
+def _write(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _last_commit_ts(repo, rel_path):
+    """Reference value: the per-path ``git log -1`` the index replaces."""
+    out = subprocess.run(
+        ["git", "-C", str(repo), "log", "-1", "--format=%ct", "--", rel_path],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return int(out) if out else None
+
+
+@pytest.fixture
+def git_repo(temp_dir):
+    """A repository whose tasks/ subtree has a known commit history."""
+    _git(temp_dir, "init", "-q")
+    tasks = temp_dir / "tasks"
+    _write(tasks / "alpha" / "seq" / "src" / "main.cpp")
+    _write(tasks / "beta" / "omp" / "main.cpp")
+    _write(temp_dir / "README.md")
+    _commit(temp_dir, 1_700_000_000)
+
+    _write(tasks / "alpha" / "seq" / "src" / "main.cpp", "changed")
+    _commit(temp_dir, 1_700_100_000)
+
+    _git(temp_dir, "mv", "tasks/beta/omp/main.cpp", "tasks/beta/omp/ops.cpp")
+    _commit(temp_dir, 1_700_200_000)
+
+    _write(temp_dir / "README.md", "outside tasks")
+    _commit(temp_dir, 1_700_300_000)
+
+    _last_commit_times.cache_clear()
+    yield temp_dir
+    _last_commit_times.cache_clear()
+
+
+class TestLastCommitTimes:
+    """Test cases for _last_commit_times."""
+
+    def test_nested_paths_match_git_log(self, git_repo):
+        """Every prefix of a changed path maps to its newest commit."""
+        times = _last_commit_times(str(git_repo / "tasks"))
+
+        assert times["alpha/seq/src/main.cpp"] == 1_700_100_000
+        assert times["alpha/seq/src"] == 1_700_100_000
+        assert times["alpha/seq"] == 1_700_100_000
+        assert times["alpha"] == 1_700_100_000
+        for rel in ("alpha", "alpha/seq", "beta", "beta/omp"):
+            assert times[rel] == _last_commit_ts(git_repo / "tasks", rel)
+
+    def test_paths_are_relative_to_root(self, git_repo):
+        """Files outside the root are not listed and do not bump timestamps."""
+        times = _last_commit_times(str(git_repo / "tasks"))
+
+        assert "README.md" not in times
+        assert not any(key.startswith("tasks/") for key in times)
+        assert max(times.values()) == 1_700_200_000
+
+    def test_renamed_file_counts_as_a_change(self, git_repo):
+        """With --no-renames both sides of a rename get the rename commit."""
+        times = _last_commit_times(str(git_repo / "tasks"))
+
+        assert times["beta/omp/ops.cpp"] == 1_700_200_000
+        assert times["beta/omp/main.cpp"] == 1_700_200_000
+        assert times["beta/omp"] == 1_700_200_000
+        assert times["beta/omp"] == _last_commit_ts(git_repo / "tasks", "beta/omp")
+
+    @pytest.mark.skipif(
+        sys.platform in ("win32", "darwin"), reason="needs arbitrary byte file names"
+    )
+    def test_non_utf8_path(self, git_repo):
+        """Undecodable names are keyed like os.scandir would name them."""
+        raw_dir = os.path.join(os.fsencode(git_repo), b"tasks", b"gamma\xff")
+        os.makedirs(os.path.join(raw_dir, b"seq"))
+        with open(os.path.join(raw_dir, b"seq", b"main.cpp"), "w") as f:
+            f.write("x")
+        _commit(git_repo, 1_700_400_000)
+        name = os.fsdecode(b"gamma\xff")
+
+        times = _last_commit_times(str(git_repo / "tasks"))
+
+        assert times[name] == 1_700_400_000
+        assert times[f"{name}/seq"] == 1_700_400_000
+
+    def test_missing_git_binary(self, git_repo, monkeypatch):
+        """Without git the index is empty and git is not retried."""
+        calls = []
+
+        def fake_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            raise FileNotFoundError(2, "No such file or directory", "git")
+
+        monkeypatch.setattr(main.subprocess, "run", fake_run)
+        root = str(git_repo / "tasks")
+
+        assert _last_commit_times(root) == {}
+        assert _last_commit_times(root) == {}
+        assert len(calls) == 1
+
+    def test_not_a_repository(self, temp_dir):
+        """A directory outside any repository yields an empty index."""
+        plain = temp_dir / "plain"
+        plain.mkdir()
+        _last_commit_times.cache_clear()
+
+        assert _last_commit_times(str(plain)) == {}
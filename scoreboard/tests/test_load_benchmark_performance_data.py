@@ -3,7 +3,9 @@ Tests for loading Google Benchmark performance JSON files.
 """
 
 import json
+import types
 
+import main
 from main import load_benchmark_performance_data, parse_benchmark_name
 
 
@@ -118,3 +120,44 @@ class TestLoadBenchmarkPerformanceData:
         result = load_benchmark_performance_data(benchmarks_dir)
 
         assert result["example_threads"]["tbb"] == "0.2"
+
+    def test_load_benchmark_json_with_nan_when_orjson_rejects_it(
+        self, temp_dir, monkeypatch
+    ):
+        """NaN literals load even when orjson is installed and refuses them."""
+
+        class StubDecodeError(json.JSONDecodeError):
+            pass
+
+        def strict_loads(raw):
+            if b"NaN" in raw:
+                raise StubDecodeError("unexpected character", raw.decode(), 0)
+            return json.loads(raw)
+
+        stub = types.SimpleNamespace(
+            loads=strict_loads, JSONDecodeError=StubDecodeError
+        )
+        monkeypatch.setattr(main, "orjson", stub)
+
+        benchmarks_dir = temp_dir / "benchmarks"
+        benchmarks_dir.mkdir()
+        (benchmarks_dir / "threads.json").write_text(
+            """{
+  "benchmarks": [
+    {"name": "example_threads_seq_enabled", "real_time": 1.5, "time_unit": "s"},
+    {"name": "example_threads_omp_enabled", "real_time": 0.5, "time_unit": "s"},
+    {
+      "name": "example_threads_omp_enabled_cv",
+      "aggregate_name": "cv",
+      "real_time": NaN,
+      "time_unit": "s"
+    }
+  ]
+}""",
+            encoding="utf-8",
+        )
+
+        result = load_benchmark_performance_data(benchmarks_dir)
+
+        assert result["example_threads"]["seq"] == "1.5"
+        assert result["example_threads"]["omp"] == "0.5"
@@ -0,0 +1,81 @@
+"""
+Tests for the efficiency percent -> performance points scale.
+"""
+
+import pytest
+
+from main import _perf_points_from_percent
+
+
+def _ladder_points(val, max_points):
+    """The original if/elif scale the bisect lookup must reproduce."""
+    if val >= 50:
+        perc = 1.0
+    elif 45 <= val < 50:
+        perc = 0.9
+    elif 42 <= val < 45:
+        perc = 0.8
+    elif 40 <= val < 42:
+        perc = 0.7
+    elif 37 <= val < 40:
+        perc = 0.6
+    elif 35 <= val < 37:
+        perc = 0.5
+    elif 32 <= val < 35:
+        perc = 0.4
+    elif 30 <= val < 32:
+        perc = 0.3
+    elif 27 <= val < 30:
+        perc = 0.2
+    elif 25 <= val < 27:
+        perc = 0.1
+    else:
+        perc = 0.0
+    pts = max_points * perc if max_points > 0 else 0.0
+    return round(pts, 2)
+
+
+class TestPerfPointsFromPercent:
+    """Test cases for _perf_points_from_percent."""
+
+    @pytest.mark.parametrize(
+        "val, expected",
+        [
+            (-5.0, 0.0),
+            (0.0, 0.0),
+            (24.99, 0.0),
+            (25.0, 1.0),
+            (26.99, 1.0),
+            (27.0, 2.0),
+            (44.99, 8.0),
+            (45.0, 9.0),
+            (49.99, 9.0),
+            (50.0, 10.0),
+            (50.01, 10.0),
+            (250.0, 10.0),
+        ],
+    )
+    def test_boundaries(self, val, expected):
+        """Thresholds are inclusive lower bounds of each bracket."""
+        assert _perf_points_from_percent(val, 10) == expected
+
+    def test_nan_scores_zero(self):
+        """NaN efficiency earns nothing, as every ladder comparison is False."""
+        assert _perf_points_from_percent(float("nan"), 10) == 0.0
+
+    def test_non_positive_max_points(self):
+        """Tasks without perf points never award any."""
+        assert _perf_points_from_percent(100.0, 0) == 0.0
+        assert _perf_points_from_percent(100.0, -3) == 0.0
+
+    def test_matches_original_ladder(self):
+        """Every threshold, its neighbours and special values score as before."""
+        values = [float("nan"), float("inf"), float("-inf"), -1.0, 0.0]
+        for threshold in (25, 27, 30, 32, 35, 37, 40, 42, 45, 50):
+            values += [threshold - 0.01, threshold, threshold + 0.01]
+        values += [v / 4 for v in range(0, 260)]
+        for max_points in (0, 3, 7, 10):
+            for val in values:
+                assert _perf_points_from_percent(val, max_points) == _ladder_points(
+                    val, max_points
+                ), (val, max_points)
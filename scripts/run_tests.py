@@ -7,6 +7,9 @@ import shutil
 import subprocess
 from pathlib import Path
 
+# Resolved once; every PPCRunner (one per --counts value) shares it
+_PROJECT_PATH = Path(__file__).resolve().parent.parent
+
 
 def init_cmd_args():
     import argparse
@@ -79,9 +82,7 @@ class PPCRunner:
 
     @staticmethod
     def __get_project_path():
-        script_path = Path(__file__).resolve()  # Absolute path of the script
-        script_dir = script_path.parent  # Directory containing the script
-        return script_dir.parent
+        return _PROJECT_PATH
 
     def setup_env(self, ppc_env):
         self.__ppc_env = ppc_env
@@ -99,7 +100,7 @@ class PPCRunner:
                 "Required environment variable 'PPC_NUM_PROC' is not set."
             )
 
-        project_path = Path(self.__get_project_path())
+        project_path = self.__get_project_path()
         build_dir = Path(self.build_dir)
         if not build_dir.is_absolute():
             build_dir = project_path / build_dir